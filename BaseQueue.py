@@ -1,5 +1,10 @@
 import math
-from numbers import Number
+import numbers
+
+# Bits of BaseQueue._state; 0 means validity/feasibility must be re-evaluated
+_STATE_KNOWN = 1
+_VALID = 2
+_FEASIBLE = 4
 
 
 class BaseQueue:
@@ -12,6 +17,7 @@ class BaseQueue:
             p0 (float): Probability that there are zero customers in the system.
             lq (float): Average number of customers in the queue.
             _recalc_needed (bool): Flag indicating whether metrics recalculation is needed.
+            _state (int): Bitmask caching is_valid()/is_feasible(), or 0 when it must be re-evaluated.
             l (float): Average number of customers in the system.
             r (float): Traffic intensity (arrival rate / service rate).
             ro (float): Traffic intensity (same as _r).
@@ -20,6 +26,8 @@ class BaseQueue:
         utilization (float): Utilization factor of the system.
     """
 
+    __slots__ = ('_lamda', '_mu', '_p0', '_lq', '_recalc_needed', '_state')
+
     def __init__(self, lamda: float, mu: float):
         """
         Initialize BaseQueue with arrival rate (λ) and service rate (μ).
@@ -43,12 +51,13 @@ class BaseQueue:
         str: Representation of the BaseQueue object.
         """
 
-        return f"<class 'BaseQueue.BaseQueue'> at {id(self)} has: " \
-               f"lamda: {self.lamda}, mu: {self.mu}, " \
-               f"Lq: {self.lq}, L: {self.l}, " \
-               f"Wq: {self.wq}, W: {self.w}, " \
-               f"p0: {self.p0}, ro: {self.ro:.4f}, " \
-               f"r: {self.r:.4f}, Utilization: {self.utilization * 100:.2f}%"
+        m = self._metrics()
+        return ("<class 'BaseQueue.BaseQueue'> at {id} has: "
+                "lamda: {lamda}, mu: {mu}, "
+                "Lq: {lq}, L: {l}, "
+                "Wq: {wq}, W: {w}, "
+                "p0: {p0}, ro: {ro:.4f}, "
+                "r: {r:.4f}, Utilization: {pct:.2f}%").format(pct=m['utilization'] * 100, **m)
 
 
     def __str__(self):
@@ -59,17 +68,18 @@ class BaseQueue:
         str: String representation including λ, μ, and recalculation status.
         """
 
-        return f"BaseQueue __str__\n<class 'BaseQueue.BaseQueue'> at {id(self)} has: \n" \
-               f"\tlamda: {self._lamda}\n" \
-               f"\tmu:\t{self._mu}\n" \
-               f"\tLq:\t{self._lq}\n" \
-               f"\tL:\t{self.l}\n" \
-               f"\tWq:\t{self.wq}\n" \
-               f"\tW:\t{self.w}\n" \
-               f"\tp0:\t{self.p0}\n" \
-               f"\tRO:\t {self.ro:.4f}\n" \
-               f"\tR:\t {self.r:.4f}\n" \
-               f"\tUtilization:\t{self.utilization * 100:.2f}%"
+        m = self._metrics()
+        return ("BaseQueue __str__\n<class 'BaseQueue.BaseQueue'> at {id} has: \n"
+                "\tlamda: {lamda}\n"
+                "\tmu:\t{mu}\n"
+                "\tLq:\t{lq}\n"
+                "\tL:\t{l}\n"
+                "\tWq:\t{wq}\n"
+                "\tW:\t{w}\n"
+                "\tp0:\t{p0}\n"
+                "\tRO:\t {ro:.4f}\n"
+                "\tR:\t {r:.4f}\n"
+                "\tUtilization:\t{pct:.2f}%").format(pct=m['utilization'] * 100, **m)
 
 
     #Getter for lamda
@@ -87,25 +97,30 @@ class BaseQueue:
     def lamda(self, value:float):
         """
         Setter for the arrival rate (λ). Validates the input and marks recalculation as needed.
+        Any positive real number (numbers.Real, e.g. a NumPy float) or a tuple of them is accepted.
 
         Args:
         value (float): New arrival rate.
         """
         # Checks if lamda is a tuple, and returns the sum if it is
         if isinstance(value, tuple):
-            if not all(isinstance(i, Number) and i > 0 for i in value):
-                self._lamda = math.nan
-            else:
-                self._lamda = sum(value)
+            # validates and sums the rates in a single pass, stopping at the first invalid one;
+            # an empty tuple has no rates to sum, so it is invalid too
+            total = 0 if value else math.nan
+            for rate in value:
+                if not isinstance(rate, numbers.Real) or not rate > 0:
+                    total = math.nan
+                    break
+                total += rate
+            self._store('_lamda', total)
         # Checks if lamda is a valid number and returns the entered value if it is
-        elif isinstance(value, Number):
+        elif isinstance(value, numbers.Real):
             if value > 0:
-                self._lamda = value
+                self._store('_lamda', value)
             else:
-                self._lamda = math.nan
+                self._store('_lamda', math.nan)
         else:
-            self._lamda = math.nan
-        self._recalc_needed = True
+            self._store('_lamda', math.nan)
 
     #Getter for mu
     @property
@@ -123,16 +138,16 @@ class BaseQueue:
     def mu(self, value: float):
         """
         Setter for the service rate (μ). Validates the input and marks recalculation as needed.
+        Any positive real number (numbers.Real, e.g. a NumPy float) is accepted.
 
         Args:
         value (float): New service rate.
         """
         # Checks if mu is a valid number and returns the entered value if it is
-        if not isinstance(value, Number) or value <= 0:
-            self._mu = math.nan
+        if not isinstance(value, numbers.Real) or value <= 0:
+            self._store('_mu', math.nan)
         else:
-            self._mu = value
-        self._recalc_needed = True
+            self._store('_mu', value)
 
     @property
     def lq(self):
@@ -144,6 +159,7 @@ class BaseQueue:
         """
         if self._recalc_needed:
             self._calc_metrics()
+            self._recalc_needed = False
         return self._lq
 
     @property
@@ -156,8 +172,44 @@ class BaseQueue:
         """
         if self._recalc_needed:
             self._calc_metrics()
+            self._recalc_needed = False
         return self._p0
 
+    def _metrics(self) -> dict:
+        """
+        Collect the inputs and all metrics once, so __repr__/__str__ can format them in a single pass.
+
+        Returns:
+        dict: id, cls, lamda, mu, lq, l, wq, w, p0, ro, r and utilization keyed by name.
+        """
+        # reading lq first runs at most one recalculation for everything below
+        lq = self.lq
+        return {'id': id(self), 'cls': self.__class__, 'lamda': self.lamda, 'mu': self.mu,
+                'lq': lq, 'l': self.l, 'wq': self.wq, 'w': self.w, 'p0': self._p0,
+                'ro': self.ro, 'r': self.r, 'utilization': self.utilization}
+
+    def _store(self, name: str, value):
+        """
+        Stores a checked input field and invalidates the cached results only if its value changed,
+        so re-assigning the current value (e.g. q.mu = q.mu) keeps the metrics.
+
+        Args:
+        name (str): Name of the field, e.g. '_mu'.
+        value: The checked value (nan when the input was invalid).
+        """
+        # an unset field or nan never compares equal, so those always invalidate
+        changed = getattr(self, name, math.nan) != value
+        setattr(self, name, value)
+        if changed:
+            self._invalidate()
+
+    def _invalidate(self):
+        """
+        Marks the cached metrics and validity as stale. Every setter calls this after storing its input.
+        """
+        self._recalc_needed = True
+        self._state = 0
+
     def _get_recalc_needed(self):
         return self._recalc_needed
 
@@ -165,12 +217,13 @@ class BaseQueue:
     def l(self):
         """
         Getter for the average number of customers in the system (L).
+        Derived from the memoized Lq, so only the first read after a setter recalculates.
 
         Returns:
         float: The average number of customers in the system.
         """
 
-        return self.lq + (self.lamda / self.mu)
+        return self.lq + (self._lamda / self._mu)
 
     @property
     def r(self):
@@ -181,7 +234,8 @@ class BaseQueue:
         float: The traffic intensity.
         """
 
-        return self.simplify_lamda() / self.mu
+        # _lamda already holds the aggregate rate, so no simplify_lamda() call is needed
+        return self._lamda / self._mu
 
     @property
     def ro(self):
@@ -203,7 +257,7 @@ class BaseQueue:
         float: The average time a customer spends in the system.
         """
 
-        return self.wq + (1 / self.mu)
+        return self.wq + (1 / self._mu)
 
     @property
     def wq(self):
@@ -213,7 +267,7 @@ class BaseQueue:
         Returns:
         float: The average time a customer spends waiting in the queue.
         """
-        return self.lq / self.lamda
+        return self.lq / self._lamda
 
     @property
     def utilization(self):
@@ -228,6 +282,8 @@ class BaseQueue:
     def _calc_metrics(self):
         """
         Calculate queueing system metrics including Lq, L, Wq, W, R, and utilization.
+        Invalid inputs give nan and infeasible ones give inf; otherwise Lq and p0 come from
+        _calc_feasible_metrics, which each queue model overrides.
         """
 
         if not self.is_valid():
@@ -236,41 +292,70 @@ class BaseQueue:
         elif not self.is_feasible():
             self._lq = math.inf
             self._p0 = math.inf
+        else:
+            self._lq, self._p0 = self._calc_feasible_metrics()
+
+    def _calc_feasible_metrics(self) -> tuple:
+        """
+        Calculate Lq and p0 for valid, feasible inputs. BaseQueue has no queue model of its own.
+
+        Returns:
+        tuple: (lq, p0)
+        """
+        return math.nan, math.nan
 
     def is_valid(self):
         """
-        Validate the input parameters (λ and μ).
+        Validate the input parameters (λ and μ). The result is cached until a setter changes an input.
 
         Returns:
         bool: True if inputs are valid, False otherwise.
         """
 
-        # validate lambda
-        if isinstance(self._lamda, tuple):
-            for i in range(len(self._lamda)):
-                if  isinstance(self._lamda[i], Number) and self._lamda[i] <= 0:
-                    return False
-        else:
-            # ensures lamda is a valid number in a valid format
-            if not isinstance(self._lamda, Number) or (self._lamda <= 0) or math.isnan(self._lamda):
-                return False
+        return bool(self._get_state() & _VALID)
+
+    def _get_state(self) -> int:
+        """
+        Returns the validity/feasibility bitmask, evaluating it once after each input change.
+
+        Returns:
+        int: Combination of _STATE_KNOWN, _VALID and _FEASIBLE.
+        """
+        state = self._state
+        if not state:
+            state = _STATE_KNOWN
+            if self._validate():
+                state |= _VALID
+                if self._feasible():
+                    state |= _FEASIBLE
+            self._state = state
+        return state
+
+    def _validate(self):
+        """
+        Run the validation checks for the input parameters (λ and μ).
+
+        Returns:
+        bool: True if inputs are valid, False otherwise.
+        """
+
+        # validate lambda; the setter always stores a number, summing tuples (nan is the only value not equal to itself)
+        if not isinstance(self._lamda, numbers.Real) or self._lamda <= 0 or self._lamda != self._lamda:
+            return False
         # ensures c and mu are in valid formats
-        if not isinstance(self._mu, Number) or (self._mu <= 0) or math.isnan(self._mu):
+        if not isinstance(self._mu, numbers.Real) or (self._mu <= 0) or self._mu != self._mu:
             return False
         return True
 
     def simplify_lamda(self):
         """
-        Calculates a simplified lamda value if λ is a tuple.
+        Returns the simplified (aggregate) lamda value. The lamda setter already reduces a tuple of
+        arrival rates to its sum, so no tuple is rebuilt or summed here.
 
         Returns:
         float: The simplified lamda value.
         """
-        if isinstance(self._lamda, tuple):
-            w_lamda = self._lamda
-        else:
-            w_lamda = (self._lamda,)
-        return sum(w_lamda)
+        return self._lamda
 
     def is_feasible(self):
         """
@@ -279,11 +364,70 @@ class BaseQueue:
         Returns:
             bool: True if the system is feasible, False otherwise.
         """
-        if self.is_valid():
-            rho = self.r
-            # Ensures rho value is feasible
-            if rho >= 1:
-                return False
-        else:
-            return False
-        return True
\ No newline at end of file
+        return bool(self._get_state() & _FEASIBLE)
+
+    def _feasible(self):
+        """
+        Run the feasibility check for inputs that already passed validation.
+
+        Returns:
+            bool: True if rho < 1, False otherwise.
+        """
+        return self.r < 1
+
+    @classmethod
+    def _calc_metrics_batch(cls, kernel, lamda, mu, *args) -> dict:
+        """
+        Calculates Lq, L, Wq, W and p0 for many parameter sets without constructing a queue for each set.
+
+        Args:
+        kernel (callable): Closed-form kernel(lamda, mu, *extra) -> (lq, p0) for a valid, feasible point.
+        lamda (iterable): Scalar arrival rates.
+        mu (iterable): Scalar service rates.
+        *args (iterable): Additional per-point parameters passed through to the kernel (e.g. sigma).
+
+        Returns:
+        dict: Lists of 'lq', 'l', 'wq', 'w' and 'p0' values, one entry per parameter set.
+
+        Raises:
+        ValueError: If the parameter iterables have different lengths.
+        """
+        metrics = {'lq': [], 'l': [], 'wq': [], 'w': [], 'p0': []}
+        # strict, so a missing parameter fails instead of silently dropping the remaining sets
+        for lam, m, *extra in zip(lamda, mu, *args, strict=True):
+            # Same rules as is_valid/is_feasible, applied to plain scalars
+            if not cls._batch_valid(lam, m, *extra):
+                lq = l = wq = w = p0 = math.nan
+            elif not cls._batch_feasible(lam, m, *extra):
+                lq = l = wq = w = p0 = math.inf
+            else:
+                lq, p0 = kernel(lam, m, *extra)
+                l = lq + lam / m
+                wq = lq / lam
+                w = wq + 1 / m
+            metrics['lq'].append(lq)
+            metrics['l'].append(l)
+            metrics['wq'].append(wq)
+            metrics['w'].append(w)
+            metrics['p0'].append(p0)
+        return metrics
+
+    @staticmethod
+    def _batch_valid(lam, m, *extra) -> bool:
+        """
+        Validation rule used by _calc_metrics_batch for one parameter set.
+
+        Returns:
+        bool: True if lam and m are positive numbers, False otherwise.
+        """
+        return isinstance(lam, numbers.Real) and lam > 0 and isinstance(m, numbers.Real) and m > 0
+
+    @staticmethod
+    def _batch_feasible(lam, m, *extra) -> bool:
+        """
+        Feasibility rule used by _calc_metrics_batch for one valid parameter set.
+
+        Returns:
+        bool: True if lam < m, False otherwise.
+        """
+        return lam < m
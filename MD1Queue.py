@@ -1,6 +1,5 @@
-import math
-
 from BaseQueue import BaseQueue
+from _queue_kernels import md1_lq
 """
     Represents a single-server queueing system (M/D/1) inheriting from BaseQueue.
     
@@ -17,7 +16,28 @@ from BaseQueue import BaseQueue
         utilization (float): Utilization of the system as a percentage of time the server is busy.
     """
 
+_REPR_FMT = ("{cls.__name__} __repr__\n"
+             "<class '{cls.__module__}.{cls.__name__}'> at {id} has: lamda: {lamda}, mu: {mu}\n"
+             "\tLq:  {lq:.4f}, L:  {l:.4f}, Wq:  {wq:.4f}, W:  {w:.4f}\n"
+             "\tp0:  {p0:.4f}, ro:  {ro:.4f}, r:  {r:.4f}, Utilization: {utilization:.2f}%").format
+
+_STR_FMT = ("{cls.__name__} __str__\n"
+            "<class '{cls.__module__}.{cls.__name__}'> at {id} has: \n"
+            "\tlamda: {lamda}\n"
+            "\tmu: \t{mu}\n"
+            "\tLq: \t {lq:.4f}\n"
+            "\tL: \t {l:.4f}\n"
+            "\tWq: \t {wq:.4f}\n"
+            "\tW: \t {w:.4f}\n"
+            "\tp0: \t {p0:.4f}\n"
+            "\tRO: \t {ro:.4f}\n"
+            "\tR: \t {r:.4f}\n"
+            "\tUtilization: {utilization:.2f}%").format
+
+
 class MD1Queue(BaseQueue):
+    __slots__ = ()
+
     def __init__(self, lamda: float, mu: float):
         """
                 Initializes an M/D/1 queueing system with given arrival and service rates.
@@ -29,49 +49,38 @@ class MD1Queue(BaseQueue):
 
         super().__init__(lamda, mu)
 
-    def _calc_metrics(self):
+    def _calc_feasible_metrics(self) -> tuple:
         """
                 Calculates queueing metrics: Lq, p0
         """
+        return md1_lq(self._lamda, self._mu)
 
-        # Checks if parameters are valid
-        if not self.is_valid():
-            self._lq = math.nan
-            self._p0 = math.nan
-        # Checks if parameters are feasible
-        elif not self.is_feasible():
-            self._lq = math.inf
-            self._p0 = math.inf
-        else:
-            self._lq = self._lamda ** 2 / (2 * self.mu * (self.mu - self._lamda))
-            self._p0 = 1 - (self._lamda / self._mu)
+    @classmethod
+    def calc_metrics_batch(cls, lamda, mu) -> dict:
+        """
+        Calculates M/D/1 metrics for many (lamda, mu) pairs, e.g. for parameter sweeps.
+        Elements may be any real numbers (numbers.Real), e.g. the items of a NumPy array.
+
+        Args:
+            lamda (iterable): Arrival rates.
+            mu (iterable): Service rates.
+
+        Returns:
+            dict: Lists of 'lq', 'l', 'wq', 'w' and 'p0' values, one entry per pair.
+
+        Raises:
+            ValueError: If the iterables have different lengths.
+        """
+        return cls._calc_metrics_batch(md1_lq, lamda, mu)
 
     def __repr__(self):
         """
         Returns a  string representation of the MD1Queue instance.
         """
-        return (
-            f"{self.__class__.__name__} __repr__\n"
-            f"<class '{self.__class__.__module__}.{self.__class__.__name__}'> at {id(self)} has: lamda: {self._lamda}, mu: {self._mu}\n"
-            f"\tLq:  {self._lq:.4f}, L:  {self.l:.4f}, Wq:  {self.wq:.4f}, W:  {self.w:.4f}\n"
-            f"\tp0:  {self._p0:.4f}, ro:  {self.ro:.4f}, r:  {self.r:.4f}, Utilization: {self.utilization:.2f}%"
-        )
+        return _REPR_FMT(**self._metrics())
 
     def __str__(self):
         """
         Returns a formatted string representation of the MD1Queue instance.
         """
-        return (
-            f"{self.__class__.__name__} __str__\n"
-            f"<class '{self.__class__.__module__}.{self.__class__.__name__}'> at {id(self)} has: \n"
-            f"\tlamda: {self._lamda}\n"
-            f"\tmu: \t{self._mu}\n"
-            f"\tLq: \t {self._lq:.4f}\n"
-            f"\tL: \t {self.l:.4f}\n"
-            f"\tWq: \t {self.wq:.4f}\n"
-            f"\tW: \t {self.w:.4f}\n"
-            f"\tp0: \t {self._p0:.4f}\n"
-            f"\tRO: \t {self.ro:.4f}\n"
-            f"\tR: \t {self.r:.4f}\n"
-            f"\tUtilization: {self.utilization:.2f}%"
-        )
\ No newline at end of file
+        return _STR_FMT(**self._metrics())
\ No newline at end of file
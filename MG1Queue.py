@@ -1,8 +1,30 @@
 
-from numbers import Number
-
 from BaseQueue import BaseQueue
+from _queue_kernels import mg1_lq
 import math
+import numbers
+
+
+_STR_FMT = ("{cls.__name__} __str__\n"
+            "<class '{cls.__module__}.{cls.__name__}'> at {id} has: \n"
+            "\tlamda: {lamda}\n"
+            "\tmu:\t{mu}\n"
+            "\tLq:\t {lq:.4f}\n"
+            "\tL:\t {l:.4f}\n"
+            "\tWq:\t {wq:.4f}\n"
+            "\tW:\t {w:.4f}\n"
+            "\tp0:\t {p0:.4f}\n"
+            "\tRO:\t {ro:.4f}\n"
+            "\tR:\t {r:.4f}\n"
+            "\tUtilization: {utilization:.2f}%\n"
+            "\tSigma: {sigma:.2f}\n").format
+
+_REPR_FMT = ("{cls.__name__} __repr__\n"
+             "<class '{cls.__module__}.{cls.__name__}'> at {id} has: "
+             "lamda: {lamda}, mu: {mu}\n"
+             "\tLq: {lq:.4f}, L: {l:.4f}, Wq: {wq:.4f}, W: {w:.4f}\n"
+             "\tp0: {p0:.4f}, ro: {ro:.4f}, r: {r:.4f}, "
+             "Utilization: {utilization:.2f}%, Sigma: {sigma:.2f}").format
 
 
 class MG1Queue(BaseQueue):
@@ -22,6 +44,9 @@ class MG1Queue(BaseQueue):
         r (float): Average number of customers in the system, including those in service.
         utilization (float): Utilization of the system as a percentage, representing the busy time of the server.
     """
+
+    __slots__ = ('_sigma',)
+
     def __init__(self, lamda: float, mu: float, sigma: float = 0.0):
         """
         Initializes an M/G/1 queueing system with specified arrival rate, service rate, and service time standard deviation.
@@ -33,8 +58,6 @@ class MG1Queue(BaseQueue):
         """
         super().__init__(lamda, mu)
         self.sigma = sigma
-        #self._recalc_needed = True
-
 
     @property
     def sigma(self) -> float:
@@ -49,7 +72,7 @@ class MG1Queue(BaseQueue):
     @sigma.setter
     def sigma(self, value: float):
         """
-        Sets the standard deviation of the service time, ensuring it is a non-negative number.
+        Sets the standard deviation of the service time, ensuring it is a non-negative real number (numbers.Real).
 
         Args:
             value (float): Standard deviation of the service time.
@@ -58,53 +81,61 @@ class MG1Queue(BaseQueue):
             self._sigma (float): If valid, sets to the given value; otherwise, sets as NaN.
         """
         # Ensures sigma value is valid
-        if isinstance(value, Number) and value >= 0:
-            self._sigma = value
+        if isinstance(value, numbers.Real) and value >= 0:
+            self._store('_sigma', value)
         else:
-            self._sigma = math.nan
-        self._recalc_needed = True
+            self._store('_sigma', math.nan)
 
-    def _calc_metrics(self):
+    def _calc_feasible_metrics(self) -> tuple:
         """
                 Calculates queueing metrics: Lq, p0
         """
-        # Checks if parameters are valid
-        if not self.is_valid():
-            self._lq = math.nan
-            self._p0 = math.nan
-        # Checks if parameters are feasible
-        elif not self.is_feasible():
-            self._lq = math.inf
-            self._p0 = math.inf
-        else:
-            self._lq = ((self.lamda ** 2 * self.sigma ** 2) + self.r ** 2) / (2 * (1 - self.r))
-            self._p0 = 1 - self.r
+        return mg1_lq(self._lamda, self._mu, self._sigma)
+
+    @classmethod
+    def calc_metrics_batch(cls, lamda, mu, sigma) -> dict:
+        """
+        Calculates M/G/1 metrics for many (lamda, mu, sigma) sets, e.g. for parameter sweeps.
+        Elements may be any real numbers (numbers.Real), e.g. the items of a NumPy array.
 
-    def is_valid(self) -> bool:
+        Args:
+            lamda (iterable): Arrival rates.
+            mu (iterable): Service rates.
+            sigma (iterable): Standard deviations of the service time.
+
+        Returns:
+            dict: Lists of 'lq', 'l', 'wq', 'w' and 'p0' values, one entry per parameter set.
+
+        Raises:
+            ValueError: If the iterables have different lengths.
+        """
+        return cls._calc_metrics_batch(mg1_lq, lamda, mu, sigma)
+
+    @staticmethod
+    def _batch_valid(lam, m, s) -> bool:
+        """
+        Adds the sigma check to the batch validation rule.
+
+        Returns:
+            bool: True if lam, m and sigma are valid, False otherwise.
+        """
+        # An invalid sigma makes the whole point invalid
+        return isinstance(s, numbers.Real) and s >= 0 and BaseQueue._batch_valid(lam, m)
+
+    def _validate(self) -> bool:
         """
         Checks if the queue configuration is valid by ensuring sigma is a non-negative number.
 
         Returns:
             bool: True if sigma is valid and non-negative, False otherwise.
         """
-        if not isinstance(self.sigma, Number):
+        if not isinstance(self.sigma, numbers.Real):
             return False
-        if math.isnan(self._sigma):
+        if self._sigma != self._sigma:
             return False
         if self.sigma < 0:
             return False
-        return super().is_valid()
-
-    def is_feasible(self) -> bool:
-        """
-                Checks if the queue configuration is feasible by verifying that arrival rate is less than service rate.
-
-                Returns:
-                    bool: True if arrival rate is less than service rate, False otherwise.
-                """
-        if self._lamda == self._mu:
-            return False
-        return super().is_valid()
+        return super()._validate()
 
     def __str__(self):
         """
@@ -113,19 +144,7 @@ class MG1Queue(BaseQueue):
         Returns:
             str: A formatted string displaying key metrics and attributes.
         """
-        return (f"{self.__class__.__name__} __str__\n"
-                f"<class '{self.__class__.__module__}.{self.__class__.__name__}'> at {id(self)} has: \n"
-                f"\tlamda: {self.lamda}\n"
-                f"\tmu:\t{self.mu}\n"
-                f"\tLq:\t {self.lq:.4f}\n"
-                f"\tL:\t {self.l:.4f}\n"
-                f"\tWq:\t {self.wq:.4f}\n"
-                f"\tW:\t {self.w:.4f}\n"
-                f"\tp0:\t {self.p0:.4f}\n"
-                f"\tRO:\t {self.ro:.4f}\n"
-                f"\tR:\t {self.r:.4f}\n"
-                f"\tUtilization: {self.utilization:.2f}%\n"
-                f"\tSigma: {self.sigma:.2f}\n")
+        return _STR_FMT(**self._metrics())
 
     def __repr__(self):
         """
@@ -134,9 +153,15 @@ class MG1Queue(BaseQueue):
         Returns:
             str: A formatted string displaying key metrics and attributes.
         """
-        return (f"{self.__class__.__name__} __repr__\n"
-                f"<class '{self.__class__.__module__}.{self.__class__.__name__}'> at {id(self)} has: "
-                f"lamda: {self.lamda}, mu: {self.mu}\n"
-                f"\tLq: {self.lq:.4f}, L: {self.l:.4f}, Wq: {self.wq:.4f}, W: {self.w:.4f}\n"
-                f"\tp0: {self.p0:.4f}, ro: {self.ro:.4f}, r: {self.r:.4f}, "
-                f"Utilization: {self.utilization:.2f}%, Sigma: {self.sigma:.2f}")
+        return _REPR_FMT(**self._metrics())
+
+    def _metrics(self) -> dict:
+        """
+        Adds sigma to the metrics snapshot used by __str__/__repr__.
+
+        Returns:
+            dict: The base metrics plus sigma.
+        """
+        metrics = super()._metrics()
+        metrics['sigma'] = self._sigma
+        return metrics
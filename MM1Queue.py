@@ -1,6 +1,25 @@
-import math
-
 from BaseQueue import BaseQueue
+from _queue_kernels import mm1_lq
+
+
+_REPR_FMT = ("<class '{cls.__module__}.{cls.__name__}'> "
+             "at {id} has: "
+             "lamda: {lamda}, mu: {mu}\n"
+             "\tLq: {lq:.4f}, L: {l:.4f}, Wq: {wq:.4f}, W: {w:.4f}\n"
+             "\tp0: {p0:.4f}, ro: {ro:.4f}, r: {r:.4f}, Utilization: {utilization:.2f}%").format
+
+_STR_FMT = ("<class '{cls.__module__}.{cls.__name__}'> "
+            "at {id} has: \n"
+            "\tlamda: {lamda}\n"
+            "\tmu:    {mu}\n"
+            "\tLq:    {lq:.4f}\n"
+            "\tL:     {l:.4f}\n"
+            "\tWq:    {wq:.4f}\n"
+            "\tW:     {w:.4f}\n"
+            "\tp0:    {p0:.4f}\n"
+            "\tRO:    {ro:.4f}\n"
+            "\tR:     {r:.4f}\n"
+            "\tUtilization: {utilization:.2f}%").format
 
 
 class MM1Queue(BaseQueue):
@@ -19,6 +38,9 @@ class MM1Queue(BaseQueue):
             r (float): Average number of customers in the system including the one in service.
             utilization (float): Utilization of the system in percentage.
         """
+
+    __slots__ = ()
+
     def __init__(self, lamda: float, mu: float):
         """
         Initializes the M/M/1 queue with arrival rate (lamda) and service rate (mu).
@@ -30,19 +52,29 @@ class MM1Queue(BaseQueue):
         """
         super().__init__(lamda, mu)
 
-    def _calc_metrics(self):
+    def _calc_feasible_metrics(self) -> tuple:
         """
                 Calculates queueing metrics: Lq, p0
         """
-        if not self.is_valid():
-            self._lq = math.nan
-            self._p0 = math.nan
-        elif not self.is_feasible():
-            self._lq = math.inf
-            self._p0 = math.inf
-        else:
-            self._lq = self.lamda ** 2 / (self.mu * (self.mu - self.lamda))
-            self._p0 = 1 - (self.lamda / self.mu)
+        return mm1_lq(self._lamda, self._mu)
+
+    @classmethod
+    def calc_metrics_batch(cls, lamda, mu) -> dict:
+        """
+        Calculates M/M/1 metrics for many (lamda, mu) pairs, e.g. for parameter sweeps.
+        Elements may be any real numbers (numbers.Real), e.g. the items of a NumPy array.
+
+        Args:
+        lamda (iterable): Arrival rates.
+        mu (iterable): Service rates.
+
+        Returns:
+        dict: Lists of 'lq', 'l', 'wq', 'w' and 'p0' values, one entry per pair.
+
+        Raises:
+        ValueError: If the iterables have different lengths.
+        """
+        return cls._calc_metrics_batch(mm1_lq, lamda, mu)
 
     def __repr__(self) -> str:
         """
@@ -51,11 +83,7 @@ class MM1Queue(BaseQueue):
         Returns:
         str: Representation including class name, memory location, lamda, and mu.
         """
-        return (f"<class '{self.__class__.__module__}.{self.__class__.__name__}'> "
-                f"at {id(self)} has: "
-                f"lamda: {self.lamda}, mu: {self.mu}\n"
-                f"\tLq: {self.lq:.4f}, L: {self.l:.4f}, Wq: {self.wq:.4f}, W: {self.w:.4f}\n"
-                f"\tp0: {self.p0:.4f}, ro: {self.ro:.4f}, r: {self.r:.4f}, Utilization: {self.utilization:.2f}%")
+        return _REPR_FMT(**self._metrics())
 
     def __str__(self) -> str:
         """
@@ -64,15 +92,4 @@ class MM1Queue(BaseQueue):
         Returns:
         str: Detailed representation including class name, memory location, lamda, mu, and metrics.
         """
-        return (f"<class '{self.__class__.__module__}.{self.__class__.__name__}'> "
-                f"at {id(self)} has: \n"
-                f"\tlamda: {self.lamda}\n"
-                f"\tmu:    {self.mu}\n"
-                f"\tLq:    {self.lq:.4f}\n"
-                f"\tL:     {self.l:.4f}\n"
-                f"\tWq:    {self.wq:.4f}\n"
-                f"\tW:     {self.w:.4f}\n"
-                f"\tp0:    {self.p0:.4f}\n"
-                f"\tRO:    {self.ro:.4f}\n"
-                f"\tR:     {self.r:.4f}\n"
-                f"\tUtilization: {self.utilization:.2f}%")
\ No newline at end of file
+        return _STR_FMT(**self._metrics())
\ No newline at end of file
@@ -4,6 +4,25 @@ import math
 from MMcQueue import MMcQueue
 
 
+_STR_FMT = ("{cls.__name__} __str__\n"
+            "<class '{cls.__name__}'> at {id} has:\n\t"
+            "lamda: {lamda}\n\tmu:\t{mu}\n\tLq:\t {lq:.4f}\n\tL:\t {l:.4f}\n\t"
+            "Wq:\t {wq:.4f}\n\tW:\t {w:.4f}\n\tp0:\t {p0:.4f}\n\t"
+            "RO:\t {ro:.4f}\n\tR:\t {r:.4f}\n\t"
+            "Utilization: {utilization:.2f}%\n\tc: {c}\n\t{priority_metrics}").format
+
+_REPR_FMT = ("{cls.__name__} __repr__\n"
+             "<class '{cls.__name__}'> at {id} has: lamda: {lamda}, mu: {mu}\n\t"
+             "Lq: {lq:.4f}, L: {l:.4f}, Wq: {wq:.4f}, W: {w:.4f}\n\t"
+             "p0: {p0:.4f}, ro: {ro:.4f}, r: {r:.4f}, Utilization: {utilization:.2f}%, c: {c}\n\t"
+             "{priority_metrics}").format
+
+# One line per priority class, formatted from values computed once per class
+_CLASS_STR_FMT = "wq_{k}: {wq: .4f},  w_{k}: {w: .4f},  lq_{k}: {lq: .4f},  l_{k}: {l: .4f}".format
+
+_CLASS_REPR_FMT = "Wq_{k}: {wq: .4f},  W_{k}: {w: .4f},  Lq_{k}: {lq: .4f},  L_{k}: {l: .4f}".format
+
+
 class MMcPriorityQueue(MMcQueue):
     """
     Represents a priority-based multi-server queueing system (M/M/c) extending MMcQueue.
@@ -17,23 +36,28 @@ class MMcPriorityQueue(MMcQueue):
         mu (float): Service rate per server.
         c (int): Number of servers in the system.
         _lamda_k (tuple): Arrival rates for each priority class.
+        _bk_cache (list): Prefix values b_0 .. b_K, rebuilt by _calc_metrics.
+        _wqk_cache (tuple): wq_1 .. wq_K, computed on first use after each recalculation.
         utilization (float): System utilization percentage.
         ro (float): Traffic intensity across the system.
         p0 (float): Probability that the system is empty.
         _recalc_needed (bool): Flag indicating if metrics need recalculation.
     """
 
+    __slots__ = ('_lamda_k', '_bk_cache', '_wqk_cache')
+
     def __init__(self, lamda: float, mu: float, c: int):
         """
                 Initializes a priority-based M/M/c queue with aggregate and individual arrival rates.
 
                 Args:
-                    lamda (float): Total arrival rate across all classes.
+                    lamda (tuple): Arrival rates for each priority class (a single rate is one class).
                     mu (float): Service rate for each server.
                     c (int): Number of servers in the system.
                 """
+        self._bk_cache = None
+        self._wqk_cache = None
         super().__init__(lamda, mu, c)
-        self._lamda_k = lamda
 
     @property
     def lamda_k(self):
@@ -53,15 +77,7 @@ class MMcPriorityQueue(MMcQueue):
         Args:
             values (tuple): Tuple containing lambda values for each priority class.
         """
-
-        # Checks each value in tuple for validity
-        for i in range(len(values)):
-            if isinstance(values[i], float) and values[i] > 0:
-                self._lamda_k = values
-        # Calculates aggregate lamda
-        self.lamda = self.simplify_lamda()
-        self._recalc_needed = True
-
+        self.lamda = values
 
     @property
     def lamda(self):
@@ -74,61 +90,64 @@ class MMcPriorityQueue(MMcQueue):
         return self._lamda
 
     @lamda.setter
-    def lamda(self, value: float):
+    def lamda(self, value: tuple):
         """
-        Sets the aggregate arrival rate based on the sum of lamda_k values.
+        Sets the per-class arrival rates and the aggregate arrival rate (their sum).
 
         Args:
-            value (float): The calculated aggregate arrival rate.
+            value (tuple): Arrival rates for each priority class; a single rate is treated as one class.
         """
+        lamda_k = value if isinstance(value, tuple) else (value,)
+        # A new split of the same aggregate still changes the per-class metrics
+        changed = getattr(self, '_lamda_k', None) != lamda_k
+        self._lamda_k = lamda_k
+        # The base setter validates every class rate and stores the aggregate (or nan)
+        MMcQueue.lamda.fset(self, value)
+        if changed:
+            self._invalidate()
+
+    def _calc_metrics(self):
+        """
+        Calculates Lq and p0 for the whole system, rebuilds the per-class b_k prefix cache and
+        drops the per-class wq_k values of the previous state.
+        """
+        super()._calc_metrics()
+        self._bk_cache = self._compute_bk_prefix() if self.is_feasible() else None
+        self._wqk_cache = None
 
-        #Checks validity if lamda value
-        if isinstance(value, (int, float)) and value > 0:
-            self._lamda = self.simplify_lamda()
-        else:
-            self._lamda = math.nan
-
-        if math.isnan(self._lamda):
-            self._lamda_k = math.nan
-        else:
-            self._lamda_k = value
-
-        self._recalc_needed = True
-
-    def simplify_lamda(self):
+    def _compute_bk_prefix(self) -> list:
         """
-        Computes the aggregate arrival rate by summing individual lamda_k values.
+        Computes b_k = 1 - (rho_1 + ... + rho_k) for every priority class with one running sum.
 
         Returns:
-            float: Sum of lamda_k values, or math.nan if data is invalid.
+            list: b_0 .. b_K, where b_0 is 1.
         """
-        #Returns aggregate lamda
-        return sum(self._lamda_k) if all(isinstance(val, (int, float)) for val in self._lamda_k) else math.nan
+        cmu = self._c * self._mu
+        b_k = [1]
+        cum_rho = 0
+        for lamda_j in self._lamda_k:
+            cum_rho += lamda_j / cmu
+            b_k.append(1 - cum_rho)
+        return b_k
 
     def get_b_k(self, k: int) -> float:
         """
         Computes the blocking probability for priority class k.
 
         Args:
-            k (int): Index of the priority class (1-based).
+            k (int): Index of the priority class (1-based, 0 returns 1).
 
         Returns:
             float: Blocking probability for priority class k.
         """
-        if k <= len(self._lamda_k):
+        if self._recalc_needed:
+            self._calc_metrics()
+            self._recalc_needed = False
+        if not self.is_valid() or not 0 <= k <= len(self._lamda_k):
             return math.nan
-        if not isinstance(self.lamda, tuple):
-            w_lamda = (self.lamda,)
-        else:
-            w_lamda = self.lamda
-        if k != 0:
-            rhoj = []
-            for l in range(k):
-                rhoj.append(w_lamda[l] / (self.c * self.mu))
-            # Calculates the blocking probability
-            return 1 - sum(rhoj)
-        else:
-            return 1
+        if not self.is_feasible():
+            return math.inf
+        return self._bk_cache[k]
 
     def get_l_k(self, k: int) -> float:
         """
@@ -152,35 +171,11 @@ class MMcPriorityQueue(MMcQueue):
         Returns:
             float: Arrival rate for priority class k.
         """
-        if k <= 0 or k < len(self._lamda_k):
+        # Every class rate must be valid and k must name an existing class
+        if self._lamda != self._lamda or not 1 <= k <= len(self._lamda_k):
             return math.nan
-        # Iterates through the tuple, lamda_k, and ensures that every value is valid
-        for i in range(len(self._lamda_k)):
-            try:
-                if self._lamda_k[i] <= 0:
-                    return math.nan
-            except TypeError:
-                return math.nan
         return self.lamda_k[k-1]
 
-    def is_valid(self) -> bool:
-        """
-                Checks if the queue system parameters are valid.
-
-                Returns:
-                    bool: True if valid, otherwise False.
-                """
-        # Iterates through the tuple, lamda_k, and ensures that every value is valid
-        for i in range(len(self._lamda_k)):
-            try:
-                if self._lamda_k[i] <= 0:
-                    return False
-            except TypeError:
-                return False
-        if math.isnan(self.mu):
-            return False
-        return True
-
     def get_lq_k(self, k: int) -> float:
         """
         Computes the average number of customers in the queue for priority class k.
@@ -204,7 +199,7 @@ class MMcPriorityQueue(MMcQueue):
         Returns:
             float: Traffic intensity for priority class k.
         """
-        return self.get_lamda_k(k) / (self.c * self.mu)
+        return self.get_lamda_k(k) / (self._c * self._mu)
 
     def get_w_k(self, k: int) -> float:
         """
@@ -228,7 +223,80 @@ class MMcPriorityQueue(MMcQueue):
         Returns:
             float: Average waiting time in the queue for priority class k.
         """
-        return (1-self.ro) * self.wq / (self.get_b_k(k-1) * self.get_b_k(k))
+        # an unknown class is nan even when the queue is infeasible, as in get_b_k
+        if not self.is_valid() or not 1 <= k <= len(self._lamda_k):
+            return math.nan
+        if not self.is_feasible():
+            return math.inf
+        return self.get_wq_k_all()[k - 1]
+
+    def get_class_metrics(self, k: int) -> tuple:
+        """
+        Computes wq_k, w_k, lq_k and l_k for priority class k from a single wq_k lookup.
+
+        Args:
+            k (int): Index of the priority class (1-based).
+
+        Returns:
+            tuple: (wq_k, w_k, lq_k, l_k), equal to the individual get_*_k results.
+        """
+        wq = self.get_wq_k(k)
+        w = 1 / self._mu + wq
+        lamda = self.get_lamda_k(k)
+        return wq, w, lamda * wq, lamda * w
+
+    def get_wq_k_all(self) -> tuple:
+        """
+        Computes the average waiting time in the queue for every priority class in one pass.
+        The result is kept until the next recalculation, so get_wq_k(k) is a lookup.
+
+        Returns:
+            tuple: wq_1 .. wq_K, equal to get_wq_k(k) for each k.
+        """
+        # Reading wq runs any pending recalculation, which also refreshes the b_k cache
+        wq = self.wq
+        if self._wqk_cache is None:
+            classes = len(self._lamda_k)
+            if not self.is_valid():
+                self._wqk_cache = (math.nan,) * classes
+            elif not self.is_feasible():
+                self._wqk_cache = (math.inf,) * classes
+            else:
+                scale = (1 - self.ro) * wq
+                b_k = self._bk_cache
+                # Pairs each b_(k-1) with b_k by walking the prefix list and its one-step shift together
+                self._wqk_cache = tuple(scale / (b_prev * b_curr) for b_prev, b_curr in zip(b_k, b_k[1:]))
+        return self._wqk_cache
+
+    def _class_metrics_all(self) -> list:
+        """
+        Computes wq_k, w_k, lq_k and l_k for every priority class in one pass.
+
+        Returns:
+            list: One (wq, w, lq, l) tuple per priority class.
+        """
+        classes = len(self._lamda_k)
+        # Class rates only take part when every one of them is valid (as in get_lamda_k)
+        lamdas = self._lamda_k if self._lamda == self._lamda else (math.nan,) * classes
+        service = 1 / self.mu
+        rows = []
+        for lamda, wq in zip(lamdas, self.get_wq_k_all()):
+            w = service + wq
+            rows.append((wq, w, lamda * wq, lamda * w))
+        return rows
+
+    def _format_priority_metrics(self, line_fmt) -> str:
+        """
+        Formats the per-class wq, w, lq and l lines used by __str__/__repr__.
+
+        Args:
+            line_fmt (callable): Bound format method of the per-class line template.
+
+        Returns:
+            str: One formatted line per priority class, joined by newline-tab.
+        """
+        return "\n\t".join([line_fmt(k=k, wq=wq, w=w, lq=lq, l=l)
+                            for k, (wq, w, lq, l) in enumerate(self._class_metrics_all(), 1)])
 
     def __str__(self):
         """
@@ -237,20 +305,7 @@ class MMcPriorityQueue(MMcQueue):
         Returns:
             str: Formatted string displaying queue metrics in a readable format.
         """
-        priority_metrics = "\n\t".join([
-            f"wq_{k + 1}: {self.get_wq_k(k + 1): .4f},  w_{k + 1}: {self.get_w_k(k + 1): .4f},"
-            f"  lq_{k + 1}: {self.get_lq_k(k + 1): .4f},  l_{k + 1}: {self.get_l_k(k + 1): .4f}"
-            for k in range(len(self.lamda_k))
-        ])
-
-        return (
-            f"{self.__class__.__name__} __str__\n"
-            f"<class '{self.__class__.__name__}'> at {id(self)} has:\n\t"
-            f"lamda: {self.lamda}\n\tmu:\t{self.mu}\n\tLq:\t {self.lq:.4f}\n\tL:\t {self.l:.4f}\n\t"
-            f"Wq:\t {self.wq:.4f}\n\tW:\t {self.w:.4f}\n\tp0:\t {self.p0:.4f}\n\t"
-            f"RO:\t {self.ro:.4f}\n\tR:\t {self.r:.4f}\n\t"
-            f"Utilization: {self.utilization:.2f}%\n\tc: {self.c}\n\t{priority_metrics}"
-        )
+        return _STR_FMT(priority_metrics=self._format_priority_metrics(_CLASS_STR_FMT), **self._metrics())
 
     def __repr__(self):
         """
@@ -259,16 +314,4 @@ class MMcPriorityQueue(MMcQueue):
         Returns:
             str: Formatted string with detailed queue metrics.
         """
-        priority_metrics = "\n\t".join([
-            f"Wq_{k + 1}: {self.get_wq_k(k + 1): .4f},  W_{k + 1}: {self.get_w_k(k + 1): .4f},"
-            f"  Lq_{k + 1}: {self.get_lq_k(k + 1): .4f},  L_{k + 1}: {self.get_l_k(k + 1): .4f}"
-            for k in range(len(self.lamda_k))
-        ])
-
-        return (
-            f"{self.__class__.__name__} __repr__\n"
-            f"<class '{self.__class__.__name__}'> at {id(self)} has: lamda: {self.lamda}, mu: {self.mu}\n\t"
-            f"Lq: {self.lq:.4f}, L: {self.l:.4f}, Wq: {self.wq:.4f}, W: {self.w:.4f}\n\t"
-            f"p0: {self.p0:.4f}, ro: {self.ro:.4f}, r: {self.r:.4f}, Utilization: {self.utilization:.2f}%, c: {self.c}\n\t"
-            f"{priority_metrics}"
-        )
\ No newline at end of file
+        return _REPR_FMT(priority_metrics=self._format_priority_metrics(_CLASS_REPR_FMT), **self._metrics())
@@ -1,5 +1,27 @@
 from BaseQueue import BaseQueue
+from _queue_kernels import mmc_lq
 import math
+import numbers
+
+
+_REPR_FMT = ("<class '{cls.__module__}.{cls.__name__}'> "
+             "at {id} has: lamda: {lamda}, mu: {mu}\n"
+             "\tLq: {lq:.4f}, L: {l:.4f}, Wq: {wq:.4f}, W: {w:.4f}\n"
+             "\tp0: {p0:.4f}, ro: {ro:.4f}, r: {r:.4f}, Utilization: {utilization:.2f}%, c: {c}").format
+
+_STR_FMT = ("<class '{cls.__module__}.{cls.__name__}'> "
+            "at {id} has: \n"
+            "\tlamda: {lamda}\n"
+            "\tmu:    {mu}\n"
+            "\tLq:    {lq:.4f}\n"
+            "\tL:     {l:.4f}\n"
+            "\tWq:    {wq:.4f}\n"
+            "\tW:     {w:.4f}\n"
+            "\tp0:    {p0:.4f}\n"
+            "\tRO:    {ro:.4f}\n"
+            "\tR:     {r:.4f}\n"
+            "\tUtilization: {utilization:.2f}%\n"
+            "\tc: {c}").format
 
 
 class MMcQueue(BaseQueue):
@@ -19,6 +41,9 @@ class MMcQueue(BaseQueue):
             r (float): Average number of customers in the system including those in service.
             utilization (float): Utilization of the system in percentage.
         """
+
+    __slots__ = ('_c',)
+
     def __init__(self, lamda: float, mu: float, c: int):
         """
         Initializes the M/M/c queue with arrival rate (lamda), service rate (mu), and number of servers (c).
@@ -45,17 +70,17 @@ class MMcQueue(BaseQueue):
     @c.setter
     def c(self, value: int):
         """
-        Setter for the number of servers (c).
+        Setter for the number of servers (c). Any positive integral number is accepted
+        (numbers.Integral, e.g. a NumPy integer); anything else is stored as nan.
 
         Args:
         value (int): Number of servers.
         """
 
-        if not isinstance(value, int) or value <= 0:
-            self._c = math.nan
+        if not isinstance(value, numbers.Integral) or value <= 0:
+            self._store('_c', math.nan)
         else:
-            self._c = value
-        self._recalc_needed = True
+            self._store('_c', value)
 
     @property
     def ro(self):
@@ -65,41 +90,73 @@ class MMcQueue(BaseQueue):
         Returns:
         float: The traffic intensity.
         """
-        return self.r /self.c
+        return self._lamda / self._mu / self._c
 
-    def _calc_metrics(self):
+    def _calc_feasible_metrics(self) -> tuple:
         """
-        Calculates queueing metrics: Lq, L, Wq, W, p0, ro, r, and utilization.
+        Calculates queueing metrics: Lq and p0 (L, Wq, W, ro, r and utilization derive from them).
         """
+        return mmc_lq(self._lamda, self._mu, self._c)
 
-        if not self.is_valid():
-            self._lq = math.nan
-            self._p0 = math.nan
-        elif not self.is_feasible():
-            self._lq = math.inf
-            self._p0 = math.inf
-        else:
-            # Formulas for calculating p0 and lq
-            term1 = sum((self.r ** i) / math.factorial(i) for i in range(self.c))
-            term2 = (self.r ** self.c) / (math.factorial(self.c) * (1 - self.ro))
-            self._p0 = 1 / (term1 + term2)
-            num = self.r ** self.c * self.ro
-            den = math.factorial(self.c) * (1 - self.ro) ** 2
-            self._lq = self._p0 * num / den
+    def _validate(self) -> bool:
+        """
+        Adds the server-count check to the lamda and mu validation.
+
+        Returns:
+        bool: True if c is a positive integer and lamda and mu are valid, False otherwise.
+        """
+        # the c setter stores nan for anything but a positive int
+        if self._c != self._c:
+            return False
+        return super()._validate()
 
-    def is_feasible(self):
+    def _feasible(self):
         """
-                Check if the system is feasible (ro < 1).
+                Check the feasibility condition (ro < 1) for valid inputs.
 
                 Returns:
-                    bool: True if the system is feasible, False otherwise.
+                    bool: True if ro < 1, False otherwise.
                 """
-        if self.is_valid():
-            if self.ro >= 1:
-                return False
-        else:
-            return False
-        return True
+        return self.ro < 1
+
+    @classmethod
+    def calc_metrics_batch(cls, lamda, mu, c) -> dict:
+        """
+        Calculates M/M/c metrics for many (lamda, mu, c) sets, e.g. for server-count sweeps.
+        Elements may be any real numbers (numbers.Real, numbers.Integral for c), e.g. the items of a NumPy array.
+
+        Args:
+        lamda (iterable): Arrival rates.
+        mu (iterable): Service rates per server.
+        c (iterable): Numbers of servers.
+
+        Returns:
+        dict: Lists of 'lq', 'l', 'wq', 'w' and 'p0' values, one entry per parameter set.
+
+        Raises:
+        ValueError: If the iterables have different lengths.
+        """
+        return cls._calc_metrics_batch(mmc_lq, lamda, mu, c)
+
+    @staticmethod
+    def _batch_valid(lam, m, c) -> bool:
+        """
+        Adds the server-count check to the batch validation rule.
+
+        Returns:
+        bool: True if lam, m and c are valid, False otherwise.
+        """
+        return isinstance(c, numbers.Integral) and c > 0 and BaseQueue._batch_valid(lam, m)
+
+    @staticmethod
+    def _batch_feasible(lam, m, c) -> bool:
+        """
+        Batch feasibility rule for c servers (ro < 1).
+
+        Returns:
+        bool: True if lam < c * m, False otherwise.
+        """
+        return lam < c * m
 
     def __repr__(self) -> str:
         """
@@ -108,10 +165,7 @@ class MMcQueue(BaseQueue):
         Returns:
         str: Representation including class name, memory location, lamda, mu, and metrics.
         """
-        return (f"<class '{self.__class__.__module__}.{self.__class__.__name__}'> "
-                f"at {id(self)} has: lamda: {self.lamda}, mu: {self.mu}\n"
-                f"\tLq: {self.lq:.4f}, L: {self.l:.4f}, Wq: {self.wq:.4f}, W: {self.w:.4f}\n"
-                f"\tp0: {self.p0:.4f}, ro: {self.ro:.4f}, r: {self.r:.4f}, Utilization: {self.utilization:.2f}%, c: {self.c}")
+        return _REPR_FMT(**self._metrics())
 
     def __str__(self) -> str:
         """
@@ -120,16 +174,15 @@ class MMcQueue(BaseQueue):
         Returns:
         str: Detailed representation including class name, memory location, lamda, mu, and metrics.
         """
-        return (f"<class '{self.__class__.__module__}.{self.__class__.__name__}'> "
-                f"at {id(self)} has: \n"
-                f"\tlamda: {self.lamda}\n"
-                f"\tmu:    {self.mu}\n"
-                f"\tLq:    {self.lq:.4f}\n"
-                f"\tL:     {self.l:.4f}\n"
-                f"\tWq:    {self.wq:.4f}\n"
-                f"\tW:     {self.w:.4f}\n"
-                f"\tp0:    {self.p0:.4f}\n"
-                f"\tRO:    {self.ro:.4f}\n"
-                f"\tR:     {self.r:.4f}\n"
-                f"\tUtilization: {self.utilization:.2f}%\n"
-                f"\tc: {self.c}")
+        return _STR_FMT(**self._metrics())
+
+    def _metrics(self) -> dict:
+        """
+        Adds the number of servers to the metrics snapshot used by __str__/__repr__.
+
+        Returns:
+        dict: The base metrics plus c.
+        """
+        metrics = super()._metrics()
+        metrics['c'] = self._c
+        return metrics
@@ -0,0 +1,93 @@
+"""
+Closed-form queueing formulas shared by the queue classes and their batch helpers.
+
+Each kernel expects plain scalar inputs that have already been validated and found feasible
+(0 < lamda < mu, or 0 < lamda < c * mu for M/M/c), and returns an (lq, p0) tuple. Results
+are memoized in bounded caches, since the same parameter sets are often evaluated repeatedly
+(e.g. re-created queues while exploring a model, or revisited points in an optimization loop).
+"""
+
+from functools import lru_cache
+
+_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def mm1_lq(lamda: float, mu: float) -> tuple:
+    """
+    Computes Lq and p0 for an M/M/1 queue.
+
+    Args:
+        lamda (float): Arrival rate.
+        mu (float): Service rate.
+
+    Returns:
+        tuple: (lq, p0)
+    """
+    return lamda ** 2 / (mu * (mu - lamda)), 1 - (lamda / mu)
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def md1_lq(lamda: float, mu: float) -> tuple:
+    """
+    Computes Lq and p0 for an M/D/1 queue.
+
+    Args:
+        lamda (float): Arrival rate.
+        mu (float): Service rate.
+
+    Returns:
+        tuple: (lq, p0)
+    """
+    return lamda ** 2 / (2 * mu * (mu - lamda)), 1 - (lamda / mu)
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def mg1_lq(lamda: float, mu: float, sigma: float) -> tuple:
+    """
+    Computes Lq and p0 for an M/G/1 queue (Pollaczek-Khinchine formula).
+
+    Args:
+        lamda (float): Arrival rate.
+        mu (float): Service rate.
+        sigma (float): Standard deviation of the service time.
+
+    Returns:
+        tuple: (lq, p0)
+    """
+    r = lamda / mu
+    return ((lamda ** 2 * sigma ** 2) + r ** 2) / (2 * (1 - r)), 1 - r
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def mmc_lq(lamda: float, mu: float, c: int) -> tuple:
+    """
+    Computes Lq and p0 for an M/M/c queue.
+
+    A single O(c) loop keeps the running term r^k/k! and its partial sum (for p0) together with
+    V(r, k) = (k / r)(V(r, k-1) + 1) (for the Erlang C probability of waiting), so no factorials
+    or large powers are formed and large c does not overflow.
+
+    Args:
+        lamda (float): Arrival rate.
+        mu (float): Service rate per server.
+        c (int): Number of servers.
+
+    Returns:
+        tuple: (lq, p0)
+    """
+    r = lamda / mu
+    if r == 0:
+        # lamda/mu underflowed (or mu is inf): no customer ever waits, and the V recursion would divide by 0
+        return 0.0, 1.0
+    ro = r / c
+    term = 1.0
+    term_sum = 0.0
+    v = 0.0
+    for k in range(1, c + 1):
+        term_sum += term
+        term *= r / k
+        v = k / r * (v + 1)
+    p0 = 1 / (term_sum + term / (1 - ro))
+    erlang_c = c / (c + (c - r) * v)
+    return erlang_c * ro / (1 - ro), p0
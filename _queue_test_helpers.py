@@ -0,0 +1,69 @@
+"""
+Comparison helpers shared by the queue test modules.
+
+All test modules use one tolerance policy: inf and nan expectations (infeasible and invalid inputs)
+must be matched exactly, and finite values must agree to rel_tol=1e-9. The expected-value tables
+carry about 15 significant digits, so this is stricter than assertAlmostEqual's 7 decimal places
+for every magnitude in them.
+"""
+
+import math
+from operator import attrgetter
+
+# metrics checked against the expected-value table of the same name
+METRICS = ('lq', 'l', 'wq', 'w', 'p0')
+
+REL_TOL = 1e-9
+ABS_TOL = 1e-12
+
+
+def matches(expected, actual) -> bool:
+    """
+    Checks one metric value against its expectation.
+
+    Args:
+        expected (float): Expected value, inf or nan.
+        actual (float): Calculated value.
+
+    Returns:
+        bool: True if the value matches under the shared tolerance policy, False otherwise.
+    """
+    if math.isinf(expected):
+        return math.isinf(actual)
+    if math.isnan(expected):
+        return math.isnan(actual)
+    return math.isclose(expected, actual, rel_tol=REL_TOL, abs_tol=ABS_TOL)
+
+
+class QueueAssertions:
+    """
+    TestCase mixin for the queue test modules. The test class's setUpClass builds q (the queues),
+    _ids (one subtest label dict per queue) and an expected-value list per metric.
+    """
+
+    def _assert_matches(self, expected, actual):
+        # one check per value; the detailed assertions only run when the values differ
+        if matches(expected, actual):
+            return
+        if math.isinf(expected):
+            self.assertTrue(math.isinf(actual))
+        elif math.isnan(expected):
+            self.assertTrue(math.isnan(actual))
+        else:
+            self.fail(f'{expected!r} != {actual!r} within rel_tol={REL_TOL}')
+
+    def _check_values(self, expected, actual, idx, **labels):
+        # actual[j] belongs to fixture case idx[j]; compare every case first and only open
+        # subtests for the cases that differ
+        for j, i in [(j, i) for j, i in enumerate(idx) if not matches(expected[i], actual[j])]:
+            with self.subTest(**labels, **self._ids[i]):
+                self._assert_matches(expected[i], actual[j])
+
+    def _check_prop(self, name, expected):
+        # one metric read from every queue
+        self._check_values(expected, list(map(attrgetter(name), self.q)), range(0, len(self.q)))
+
+    def _check_batch(self, batch, idx):
+        # batch is a calc_metrics_batch result whose entry j was computed for fixture case idx[j]
+        for name in METRICS:
+            self._check_values(getattr(self, name), batch[name], idx, metric=name)
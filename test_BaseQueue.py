@@ -1,7 +1,13 @@
 from unittest import TestCase
 from unittest import main
 import math
+from fractions import Fraction
 import BaseQueue as q
+from MM1Queue import MM1Queue
+from MD1Queue import MD1Queue
+from MG1Queue import MG1Queue
+from MMcQueue import MMcQueue
+from _queue_test_helpers import METRICS, matches
 
 
 class TestBaseQueue(TestCase):
@@ -142,6 +148,116 @@ class TestBaseQueue(TestCase):
         self.assertEqual(False, self.x.is_valid())
         self.assertEqual(False, self.x.is_feasible())
 
+    def test_setter_same_value(self):
+        # re-assigning the current value keeps the calculated metrics
+        self.x.lq
+        self.x.lamda = 20.0
+        self.x.mu = 25.0
+        self.assertFalse(self.x._recalc_needed)
+
+        # a changed value marks them for recalculation
+        self.x.mu = 30
+        self.assertTrue(self.x._recalc_needed)
+        self.assertEqual(True, self.x.is_feasible())
+
+    def test_setter_invalidates(self):
+        # every input setter must drop the cached metrics and the cached validity state
+        # (queue, input, new value, queue built with the new value)
+        cases = [(MG1Queue(20, 25, 0.02), 'lamda', 22, MG1Queue(22, 25, 0.02)),
+                 (MG1Queue(20, 25, 0.02), 'mu', 30, MG1Queue(20, 30, 0.02)),
+                 (MG1Queue(20, 25, 0.02), 'sigma', 0.03, MG1Queue(20, 25, 0.03)),
+                 (MMcQueue(20, 25, 1), 'c', 2, MMcQueue(20, 25, 2))]
+        for x, name, value, fresh in cases:
+            with self.subTest(case=f'{type(x).__name__}.{name} = {value}'):
+                x.lq
+                x.is_feasible()
+                self.assertFalse(x._recalc_needed)
+                self.assertNotEqual(0, x._state)
+
+                setattr(x, name, value)
+                self.assertTrue(x._recalc_needed)
+                self.assertEqual(0, x._state)
+
+                # the next read recalculates from the new input
+                self.assertAlmostEqual(fresh.lq, x.lq)
+                self.assertFalse(x._recalc_needed)
+
+    def test_state_after_setter(self):
+        # is_valid/is_feasible follow the inputs through every setter, in both directions
+        self.assertEqual(True, self.x.is_feasible())
+        self.x.lamda = 30
+        self.assertEqual(True, self.x.is_valid())
+        self.assertEqual(False, self.x.is_feasible())
+        self.x.lamda = 20
+        self.assertEqual(True, self.x.is_feasible())
+        self.x.mu = 0
+        self.assertEqual(False, self.x.is_valid())
+        self.assertEqual(False, self.x.is_feasible())
+        self.x.mu = 25
+        self.assertEqual(True, self.x.is_valid())
+        self.assertEqual(True, self.x.is_feasible())
+
+        y = MG1Queue(20, 25, 0.02)
+        y.sigma = -1
+        self.assertEqual(False, y.is_valid())
+        self.assertTrue(math.isnan(y.lq))
+        y.sigma = 0.02
+        self.assertEqual(True, y.is_valid())
+        self.assertEqual(True, y.is_feasible())
+
+        z = MMcQueue(30, 25, 2)
+        self.assertEqual(True, z.is_feasible())
+        z.c = 1
+        self.assertEqual(True, z.is_valid())
+        self.assertEqual(False, z.is_feasible())
+        self.assertTrue(math.isinf(z.lq))
+        z.c = 0
+        self.assertEqual(False, z.is_valid())
+        self.assertTrue(math.isnan(z.lq))
+        z.c = 2
+        self.assertEqual(True, z.is_feasible())
+        self.assertFalse(math.isinf(z.lq))
+
+    def test_calc_metrics_batch_edge_cases(self):
+        # one batch per queue type mixing feasible, invalid and infeasible points; each point must
+        # match a queue built from the same inputs (nan when invalid, inf when infeasible)
+        lamda = [20, 0, 25, "twenty", 24, -5]
+        mu = [25, 25, 25, 25, 25, 0]
+        cases = [(MM1Queue, ()), (MD1Queue, ()),
+                 (MG1Queue, ([0.04, 0.04, 0.04, 0.04, -0.04, 0.04],)),
+                 (MMcQueue, ([1, 1, 1, 1, 2, 1],))]
+        for cls, extra in cases:
+            with self.subTest(case=f'{cls.__name__} mixed batch'):
+                batch = cls.calc_metrics_batch(lamda, mu, *extra)
+                for name in METRICS:
+                    self.assertEqual(len(lamda), len(batch[name]))
+                for j, args in enumerate(zip(lamda, mu, *extra)):
+                    x = cls(*args)
+                    for name in METRICS:
+                        self.assertTrue(matches(getattr(x, name), batch[name][j]), f'{name} at {args}')
+                self.assertTrue(math.isnan(batch['lq'][1]))
+                self.assertTrue(math.isinf(batch['lq'][2]))
+
+            # a parameter list that is shorter than the others is an error, not a truncated result
+            with self.subTest(case=f'{cls.__name__} unequal lengths'):
+                with self.assertRaises(ValueError):
+                    cls.calc_metrics_batch(lamda, mu[:-1], *extra)
+                with self.assertRaises(ValueError):
+                    cls.calc_metrics_batch(lamda[:-1], mu, *extra)
+
+    def test_numbers_real_inputs(self):
+        # any numbers.Real is a valid rate (and any numbers.Integral a server count), not only int/float
+        x = MG1Queue(Fraction(20), Fraction(25), Fraction(1, 25))
+        self.assertTrue(x.is_valid())
+        self.assertAlmostEqual(MG1Queue(20, 25, 0.04).lq, x.lq)
+
+        batch = MMcQueue.calc_metrics_batch([Fraction(24)], [Fraction(25)], [2])
+        self.assertAlmostEqual(MMcQueue(24, 25, 2).lq, batch['lq'][0])
+
+        # a server count must be integral, even when its value is a whole number
+        self.assertFalse(MMcQueue(24, 25, Fraction(2)).is_valid())
+        self.assertTrue(math.isnan(MMcQueue.calc_metrics_batch([24], [25], [Fraction(2)])['lq'][0]))
+
     def test_r(self):
         self.assertAlmostEqual(0.80, self.x.r)
 
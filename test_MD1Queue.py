@@ -1,146 +1,122 @@
 from unittest import TestCase
 from unittest import main
-import math
+from math import nan, inf, isnan
 
 from MD1Queue import MD1Queue
+from _queue_test_helpers import QueueAssertions
 
 
-class TestMD1Queue(TestCase):
-    def setUp(self) -> None:
+class TestMD1Queue(QueueAssertions, TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        # the queues are only read by the tests, so they are built once for the whole class
         # construct lists of test values and corresponding results
-        self.lamda = [20, 24, 25, 0, 20, "twenty", 20, "twenty", (5, 10, 5), (5, 10, -5), (5, 10, "five")]
-        self.mu =    [25, 25, 25, 25, 0, 25, "twenty-five", "twenty-five", 25, 25, 25]
+        cls.lamda = [20, 24, 25, 0, 20, "twenty", 20, "twenty", (5, 10, 5), (5, 10, -5), (5, 10, "five")]
+        cls.mu =    [25, 25, 25, 25, 0, 25, "twenty-five", "twenty-five", 25, 25, 25]
 
-        self._lamda = [20, 24, 25, math.nan, 20.0, math.nan, 20.0, math.nan, 20.0, math.nan, math.nan]
-        self._mu = [25, 25, 25, 25, math.nan, 25.0, math.nan, math.nan, 25.0, 25.0, 25.0]
+        cls._lamda = [20, 24, 25, nan, 20.0, nan, 20.0, nan, 20.0, nan, nan]
+        cls._mu = [25, 25, 25, 25, nan, 25.0, nan, nan, 25.0, 25.0, 25.0]
 
-        self.is_valid = [True, True, True, False, False, False, False, False, True, False, False]
-        self.is_feasible = [True, True, False, False, False, False, False, False, True, False, False]
+        cls.is_valid = [True, True, True, False, False, False, False, False, True, False, False]
+        cls.is_feasible = [True, True, False, False, False, False, False, False, True, False, False]
 
-        self.lq = [1.6, 11.52, math.inf, math.nan, math.nan, math.nan, math.nan, math.nan, 1.6, math.nan, math.nan]
-        self.l = [2.4, 12.48, math.inf, math.nan, math.nan, math.nan, math.nan, math.nan, 2.4, math.nan, math.nan]
-        self.w = [0.12, 0.52, math.inf, math.nan, math.nan, math.nan, math.nan, math.nan, 0.12, math.nan, math.nan]
-        self.wq = [0.08, 0.48, math.inf, math.nan, math.nan, math.nan, math.nan, math.nan, 0.08, math.nan, math.nan]
-        self.p0 = [0.2, 0.04, math.inf, math.nan, math.nan, math.nan, math.nan, math.nan, 0.2, math.nan, math.nan]
+        cls.lq = [1.6, 11.52, inf, nan, nan, nan, nan, nan, 1.6, nan, nan]
+        cls.l = [2.4, 12.48, inf, nan, nan, nan, nan, nan, 2.4, nan, nan]
+        cls.w = [0.12, 0.52, inf, nan, nan, nan, nan, nan, 0.12, nan, nan]
+        cls.wq = [0.08, 0.48, inf, nan, nan, nan, nan, nan, 0.08, nan, nan]
+        cls.p0 = [0.2, 0.04, inf, nan, nan, nan, nan, nan, 0.2, nan, nan]
 
-        self.q = [MD1Queue(self.lamda[i], self.mu[i]) for i in range(0, len(self.lamda))]
+        cls.q = [MD1Queue(cls.lamda[i], cls.mu[i]) for i in range(0, len(cls.lamda))]
+
+        # subtest labels, built once instead of per loop iteration
+        cls._ids = [dict(lamda=la, mu=mu) for la, mu in zip(cls.lamda, cls.mu)]
 
         # print(self.x)
 
     def test_init(self):
 
         for i in range(0, len(self.q)):
-            with self.subTest(lamda=self.lamda[i], mu=self.mu[i]):
-                if math.isnan(self._lamda[i]):
-                    self.assertTrue(math.isnan(self.q[i].lamda))
+            with self.subTest(**self._ids[i]):
+                if isnan(self._lamda[i]):
+                    self.assertTrue(isnan(self.q[i].lamda))
                 else:
                     self.assertEqual(self._lamda[i], self.q[i].lamda)
 
-                if math.isnan(self._mu[i]):
-                    self.assertTrue((math.isnan(self.q[i].mu)))
+                if isnan(self._mu[i]):
+                    self.assertTrue((isnan(self.q[i].mu)))
                 else:
                     self.assertEqual(self._mu[i], self.q[i].mu)
 
     def test_valid(self):
 
         for i in range(0, len(self.q)):
-            with self.subTest(lamda=self.lamda[i], mu=self.mu[i]):
+            with self.subTest(**self._ids[i]):
                 self.assertEqual(self.is_valid[i], self.q[i].is_valid())
 
     def test_feasible(self):
         for i in range(0, len(self.q)):
-            with self.subTest(lamda=self.lamda[i], mu=self.mu[i]):
+            with self.subTest(**self._ids[i]):
                 self.assertEqual(self.is_feasible[i], self.q[i].is_feasible())
 
     def test_lq(self):
-        # test the default instance
-        for i in range(0, len(self.q)):
-            with self.subTest(lamda=self.lamda[i], mu=self.mu[i]):
-                if(math.isinf(self.lq[i])):
-                    self.assertTrue(math.isinf(self.q[i].lq))
-                elif(math.isnan(self.lq[i])):
-                    self.assertTrue(math.isnan(self.q[i].lq))
-                else:
-                    self.assertAlmostEqual(self.lq[i], self.q[i].lq)
+        self._check_prop('lq', self.lq)
 
     def test_l(self):
-        # test the default instance
-        for i in range(0, len(self.q)):
-            with self.subTest(lamda=self.lamda[i], mu=self.mu[i]):
-                if(math.isinf(self.l[i])):
-                    self.assertTrue(math.isinf(self.q[i].l))
-                elif(math.isnan(self.l[i])):
-                    self.assertTrue(math.isnan(self.q[i].l))
-                else:
-                    self.assertAlmostEqual(self.l[i], self.q[i].l)
+        self._check_prop('l', self.l)
 
     def test_wq(self):
-        # test the default instance
-        for i in range(0, len(self.q)):
-            with self.subTest(lamda=self.lamda[i], mu=self.mu[i]):
-                if(math.isinf(self.wq[i])):
-                    self.assertTrue(math.isinf(self.q[i].wq))
-                elif(math.isnan(self.wq[i])):
-                    self.assertTrue(math.isnan(self.q[i].wq))
-                else:
-                    self.assertAlmostEqual(self.wq[i], self.q[i].wq)
+        self._check_prop('wq', self.wq)
 
     def test_w(self):
-        # test the default instance
-        for i in range(0, len(self.q)):
-            with self.subTest(lamda=self.lamda[i], mu=self.mu[i]):
-                if (math.isinf(self.w[i])):
-                    self.assertTrue(math.isinf(self.q[i].w))
-                elif (math.isnan(self.w[i])):
-                    self.assertTrue(math.isnan(self.q[i].w))
-                else:
-                    self.assertAlmostEqual(self.w[i], self.q[i].w)
+        self._check_prop('w', self.w)
 
     def test_p0(self):
-        # test the default instance
-        for i in range(0, len(self.q)):
-            with self.subTest(lamda=self.lamda[i], mu=self.mu[i]):
-                if(math.isinf(self.p0[i])):
-                    self.assertTrue(math.isinf(self.q[i].p0))
-                elif(math.isnan(self.p0[i])):
-                    self.assertTrue(math.isnan(self.q[i].p0))
-                else:
-                    self.assertAlmostEqual(self.p0[i], self.q[i].p0)
+        self._check_prop('p0', self.p0)
+
+    def test_calc_metrics_batch(self):
+        # the batch results must match the expected metrics for every scalar-lamda case
+        idx = [i for i in range(0, len(self.lamda)) if not isinstance(self.lamda[i], tuple)]
+        batch = MD1Queue.calc_metrics_batch([self.lamda[i] for i in idx], [self.mu[i] for i in idx])
+        self._check_batch(batch, idx)
 
     def test_required_attributes(self):
         # force recalc cycle so that attributes created by _calc_metrics will exist
         x = MD1Queue(20, 25)
         x._calc_metrics()
 
-        # verify that required internal variables exist
+        # verify that required internal variables exist and hold a value
         for v in ['_lamda', '_mu', '_lq', '_p0', '_recalc_needed']:
             with self.subTest(case=f'Required member: {v}'):
-                self.assertTrue(v in dir(x))
+                self.assertTrue(hasattr(x, v))
 
-        # verify that attributes for child classes do not exist
+        # verify that attributes for child classes do not exist; unlike hasattr, dir() also
+        # lists slots that are declared but unset
+        attrs = set(dir(x))
         for v in ['_c', '_sigma', '_lamda_k']:
             with self.subTest(case=f'Child class member: {v}'):
-                self.assertFalse(v in dir(x))
+                self.assertNotIn(v, attrs)
 
     def test_derived_attributes(self):
         # force recalc cycle so that attributes created by _calc_metrics will exist
         x = MD1Queue(20, 25)
         x._calc_metrics()
+        attrs = set(dir(x))
 
         # verify that derived variables do not exist as saved variables
         for v in ['_l', '_wq', '_w', '_r', '_ro', '_rho', '_utilization']:
             with self.subTest(case=f'Required member: {v}'):
-                self.assertFalse(v in dir(x))
+                self.assertNotIn(v, attrs)
 
     def test_required_properties(self):
         # force recalc cycle so that attributes created by _calc_metrics will exist
         x = MD1Queue(20, 25)
         x._calc_metrics()
+        props = {name for name in dir(MD1Queue) if isinstance(getattr(MD1Queue, name), property)}
 
         # verify that required properties exist
         for v in ['lamda', 'mu', 'lq', 'l', 'wq', 'w', 'r', 'ro', 'utilization']:
             with self.subTest(case=f'Required property: {v}'):
-                self.assertTrue(isinstance(getattr(MD1Queue, v, None), property))
+                self.assertIn(v, props)
 
 if __name__ == '__main__':
     main(verbosity=2)
\ No newline at end of file
@@ -1,32 +1,36 @@
 from unittest import TestCase
 from unittest import main
 import math
+from fractions import Fraction
 
 from MMcQueue import MMcQueue
-
-
-class TestMMcQueue(TestCase):
-    def setUp(self) -> None:
-        self.lamdaj = [(20,), (24,), (5, 10, 10), (0,), (5, 10, 5), (5, 10, 5), (5, 10, 9), (10, 15, 15), (10, 15, 15), (5, 10, -5), (5, 10, "five")]
-        self.lamda = [20, 24, 25, 0, 20, 20, 24, 40, 40, math.nan, math.nan]
-        self.mu = [25, 25, 25, 25, 0, 25, 25, 25, 25, 25, 25]
-        self.c = [1, 1, 1, 1, 1, 1, 2, 3, 3, 1, 1]
-        self.is_valid = [True, True, True, False, False, True, True, True, True, False, False]
-        self.is_feasible = [True, True, False, False, False, True, True, True, True, False, False]
-        self._lamda = [20, 24, 25, math.nan, 20, 20, 24, 40, 40, math.nan, math.nan]
-        self._mu = [25, 25, 25, 25, math.nan, 25, 25, 25, 25, 25, 25]
-
-        self.lq = [3.2, 23.04, math.inf, math.nan, math.nan, 3.2, 0.287401247401247, 0.312910618792972,
+from _queue_test_helpers import METRICS, QueueAssertions
+
+
+class TestMMcQueue(QueueAssertions, TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        # the queues are only read by the tests, so they are built once for the whole class
+        cls.lamdaj = [(20,), (24,), (5, 10, 10), (0,), (5, 10, 5), (5, 10, 5), (5, 10, 9), (10, 15, 15), (10, 15, 15), (5, 10, -5), (5, 10, "five")]
+        cls.lamda = [20, 24, 25, 0, 20, 20, 24, 40, 40, math.nan, math.nan]
+        cls.mu = [25, 25, 25, 25, 0, 25, 25, 25, 25, 25, 25]
+        cls.c = [1, 1, 1, 1, 1, 1, 2, 3, 3, 1, 1]
+        cls.is_valid = [True, True, True, False, False, True, True, True, True, False, False]
+        cls.is_feasible = [True, True, False, False, False, True, True, True, True, False, False]
+        cls._lamda = [20, 24, 25, math.nan, 20, 20, 24, 40, 40, math.nan, math.nan]
+        cls._mu = [25, 25, 25, 25, math.nan, 25, 25, 25, 25, 25, 25]
+
+        cls.lq = [3.2, 23.04, math.inf, math.nan, math.nan, 3.2, 0.287401247401247, 0.312910618792972,
                    0.312910618792972, math.nan, math.nan]
-        self.l = [4, 24, math.inf, math.nan, math.nan, 4, 1.24740124740125, 1.91291061879297, 1.91291061879297,
+        cls.l = [4, 24, math.inf, math.nan, math.nan, 4, 1.24740124740125, 1.91291061879297, 1.91291061879297,
                   math.nan, math.nan]
-        self.w = [0.2, 1, math.inf, math.nan, math.nan, 0.2, 0.051975051975052, 4.78227654698243E-02,
+        cls.w = [0.2, 1, math.inf, math.nan, math.nan, 0.2, 0.051975051975052, 4.78227654698243E-02,
                   4.78227654698243E-02, math.nan, math.nan]
-        self.wq = [0.16, 0.96, math.inf, math.nan, math.nan, 0.16, 0.011975051975052, 7.82276546982429E-03,
+        cls.wq = [0.16, 0.96, math.inf, math.nan, math.nan, 0.16, 0.011975051975052, 7.82276546982429E-03,
                    7.82276546982429E-03, math.nan, math.nan]
-        self.p0 = [0.2, 0.04, math.inf, math.nan, math.nan, 0.2, 0.351351351351351, 0.187165775401069,
+        cls.p0 = [0.2, 0.04, math.inf, math.nan, math.nan, 0.2, 0.351351351351351, 0.187165775401069,
                    0.187165775401069, math.nan, math.nan]
-        self.wqk = [(0.16,), (0.96,), (math.inf,), (math.nan,), (math.nan,), (0.04, 0.1, 0.4),
+        cls.wqk = [(0.16,), (0.96,), (math.inf,), (math.nan,), (math.nan,), (0.04, 0.1, 0.4),
                     (6.91891891891892E-03, 9.88416988416989E-03, 1.71072171072171E-02),
                     (4.21225832990539E-03, 6.31838749485808E-03, 1.17341482047364E-02),
                     (4.21225832990539E-03, 6.31838749485808E-03, 1.17341482047364E-02),
@@ -34,14 +38,22 @@ class TestMMcQueue(TestCase):
                     (math.nan, math.nan, math.nan),
                     (math.nan, math.nan, math.nan)]
 
-        self.q = [MMcQueue(self.lamda[i], self.mu[i], self.c[i]) for i in range(0, len(self.lamda))]
+        # cases with identical inputs share one queue, so its metrics are calculated once
+        queues = {}
+        for key in zip(cls.lamda, cls.mu, cls.c):
+            if key not in queues:
+                queues[key] = MMcQueue(*key)
+        cls.q = [queues[key] for key in zip(cls.lamda, cls.mu, cls.c)]
+
+        # subtest labels, built once instead of per loop iteration
+        cls._ids = [dict(lamda=la, mu=mu, c=c) for la, mu, c in zip(cls.lamda, cls.mu, cls.c)]
 
         # print(self.x)
 
     def test_init(self):
 
         for i in range(0, len(self.q)):
-            with self.subTest(lamda=self.lamda[i], mu=self.mu[i], c=self.c[i]):
+            with self.subTest(**self._ids[i]):
                 if math.isnan(self._lamda[i]):
                     self.assertTrue(math.isnan(self.q[i].lamda))
                 else:
@@ -55,103 +67,108 @@ class TestMMcQueue(TestCase):
     def test_valid(self):
 
         for i in range(0, len(self.q)):
-            with self.subTest(lamda=self.lamda[i], mu=self.mu[i], c=self.c[i]):
+            with self.subTest(**self._ids[i]):
                 self.assertEqual(self.is_valid[i], self.q[i].is_valid())
 
     def test_feasible(self):
         for i in range(0, len(self.q)):
-            with self.subTest(lamda=self.lamda[i], mu=self.mu[i], c=self.c[i]):
+            with self.subTest(**self._ids[i]):
                 self.assertEqual(self.is_feasible[i], self.q[i].is_feasible())
 
     def test_lq(self):
-        # test the default instance
-        for i in range(0, len(self.q)):
-            with self.subTest(lamda=self.lamda[i], mu=self.mu[i], c=self.c[i]):
-                if(math.isinf(self.lq[i])):
-                    self.assertTrue(math.isinf(self.q[i].lq))
-                elif(math.isnan(self.lq[i])):
-                    self.assertTrue(math.isnan(self.q[i].lq))
-                else:
-                    self.assertAlmostEqual(self.lq[i], self.q[i].lq)
+        self._check_prop('lq', self.lq)
 
     def test_l(self):
-        # test the default instance
-        for i in range(0, len(self.q)):
-            with self.subTest(lamda=self.lamda[i], mu=self.mu[i], c=self.c[i]):
-                if(math.isinf(self.l[i])):
-                    self.assertTrue(math.isinf(self.q[i].l))
-                elif(math.isnan(self.l[i])):
-                    self.assertTrue(math.isnan(self.q[i].l))
-                else:
-                    self.assertAlmostEqual(self.l[i], self.q[i].l)
+        self._check_prop('l', self.l)
 
     def test_wq(self):
-        # test the default instance
-        for i in range(0, len(self.q)):
-            with self.subTest(lamda=self.lamda[i], mu=self.mu[i], c=self.c[i]):
-                if(math.isinf(self.wq[i])):
-                    self.assertTrue(math.isinf(self.q[i].wq))
-                elif(math.isnan(self.wq[i])):
-                    self.assertTrue(math.isnan(self.q[i].wq))
-                else:
-                    self.assertAlmostEqual(self.wq[i], self.q[i].wq)
+        self._check_prop('wq', self.wq)
 
     def test_w(self):
-        # test the default instance
-        for i in range(0, len(self.q)):
-            with self.subTest(lamda=self.lamda[i], mu=self.mu[i], c=self.c[i]):
-                if (math.isinf(self.w[i])):
-                    self.assertTrue(math.isinf(self.q[i].w))
-                elif (math.isnan(self.w[i])):
-                    self.assertTrue(math.isnan(self.q[i].w))
-                else:
-                    self.assertAlmostEqual(self.w[i], self.q[i].w)
+        self._check_prop('w', self.w)
 
     def test_p0(self):
-        # test the default instance
-        for i in range(0, len(self.q)):
-            with self.subTest(lamda=self.lamda[i], mu=self.mu[i], c=self.c[i]):
-                if(math.isinf(self.p0[i])):
-                    self.assertTrue(math.isinf(self.q[i].p0))
-                elif(math.isnan(self.p0[i])):
-                    self.assertTrue(math.isnan(self.q[i].p0))
-                else:
-                    self.assertAlmostEqual(self.p0[i], self.q[i].p0)
+        self._check_prop('p0', self.p0)
+
+    def test_calc_metrics_batch(self):
+        # the batch results must match the expected metrics for every scalar-lamda case
+        idx = [i for i in range(0, len(self.lamda)) if not isinstance(self.lamda[i], tuple)]
+        batch = MMcQueue.calc_metrics_batch([self.lamda[i] for i in idx], [self.mu[i] for i in idx], [self.c[i] for i in idx])
+        self._check_batch(batch, idx)
+
+    def test_large_c(self):
+        # the factorial closed form overflowed here; compare against exact rational arithmetic
+        lamda, mu, c = 4000, 25, 200
+        r = Fraction(lamda, mu)
+        term_sum = sum(r ** i / math.factorial(i) for i in range(c))
+        term = r ** c / math.factorial(c)
+        p0 = 1 / (term_sum + term / (1 - r / c))
+        lq = p0 * term * (r / c) / (1 - r / c) ** 2
+        q = MMcQueue(lamda, mu, c)
+        self._assert_matches(float(lq), q.lq)
+        self._assert_matches(float(p0), q.p0)
+
+    def test_invalid_c(self):
+        # the number of servers must be a positive int; anything else makes the queue invalid
+        for c in (0, -1, 'x'):
+            with self.subTest(c=c):
+                q = MMcQueue(20, 25, c)
+                self.assertTrue(math.isnan(q.c))
+                self.assertFalse(q.is_valid())
+                self.assertFalse(q.is_feasible())
+                for name in METRICS:
+                    self.assertTrue(math.isnan(getattr(q, name)))
+
+    def test_negligible_load(self):
+        # lamda/mu rounding to 0 is valid and feasible: nobody waits and the system is always empty
+        for lamda, mu, c in [(20, math.inf, 1), (1e-300, 1e100, 2)]:
+            with self.subTest(lamda=lamda, mu=mu, c=c):
+                q = MMcQueue(lamda, mu, c)
+                self.assertEqual(0, q.lq)
+                self.assertEqual(1, q.p0)
+                self.assertEqual(0, q.wq)
+                batch = MMcQueue.calc_metrics_batch([lamda], [mu], [c])
+                self.assertEqual(0, batch['lq'][0])
+                self.assertEqual(1, batch['p0'][0])
 
     def test_required_attributes(self):
         # force recalc cycle so that attributes created by _calc_metrics will exist
         x = MMcQueue(20, 25, 1)
         x._calc_metrics()
 
-        # verify that required internal variables exist
+        # verify that required internal variables exist and hold a value
         for v in ['_lamda', '_mu', '_c', '_lq', '_p0', '_recalc_needed']:
             with self.subTest(case=f'Required member: {v}'):
-                self.assertTrue(v in dir(x))
+                self.assertTrue(hasattr(x, v))
 
-        # verify that attributes for child classes do not exist
+        # verify that attributes for child classes do not exist; unlike hasattr, dir() also
+        # lists slots that are declared but unset
+        attrs = set(dir(x))
         for v in ['_sigma', '_lamda_k']:
             with self.subTest(case=f'Child class member: {v}'):
-                self.assertFalse(v in dir(x))
+                self.assertNotIn(v, attrs)
 
     def test_derived_attributes(self):
         # force recalc cycle so that attributes created by _calc_metrics will exist
         x = MMcQueue(20, 25, 1)
         x._calc_metrics()
+        attrs = set(dir(x))
 
         # verify that derived variables do not exist as saved variables
         for v in ['_l', '_wq', '_w', '_r', '_ro', '_rho', '_utilization']:
             with self.subTest(case=f'Required member: {v}'):
-                self.assertFalse(v in dir(x))
+                self.assertNotIn(v, attrs)
 
     def test_required_properties(self):
         # force recalc cycle so that attributes created by _calc_metrics will exist
         x = MMcQueue(20, 25, 1)
         x._calc_metrics()
+        props = {name for name in dir(MMcQueue) if isinstance(getattr(MMcQueue, name), property)}
 
         # verify that required properties exist
         for v in ['lamda', 'mu', 'c', 'lq', 'l', 'wq', 'w', 'r', 'ro', 'utilization']:
             with self.subTest(case=f'Required property: {v}'):
-                self.assertTrue(isinstance(getattr(MMcQueue, v, None), property))
+                self.assertIn(v, props)
 
 
 if __name__ == '__main__':